@@ -0,0 +1,57 @@
+from tabulate import tabulate
+import argparse
+import random
+import time
+
+import main
+
+
+def make_logs(count, per_block):
+    """Генерирует синтетические логи eth_getLogs в формате RPC"""
+    topics = list(main.DEFAULT_EVENT_DECODERS)
+    weights = [6, 3, 1]
+    guardians = ["0x" + "000000000000000000000000" + f"{i:040x}" for i in range(2000)]
+    operators = ["0x" + "000000000000000000000000" + f"{i:040X}" for i in range(1, 300)]
+
+    logs = []
+    for i in range(count):
+        block = 1_000_000 + i // per_block
+        topic0 = random.choices(topics, weights)[0]
+        log_topics = [topic0, random.choice(guardians)]
+        if main.DEFAULT_EVENT_DECODERS[topic0].get("operator"):
+            log_topics.append(random.choice(operators))
+        logs.append({
+            "blockNumber": hex(block),
+            "blockHash": f"0x{block:064x}",
+            "blockTimestamp": hex(1_700_000_000 + block),
+            "transactionHash": f"0x{i:064x}",
+            "logIndex": hex(i % per_block),
+            "topics": log_topics,
+            "data": f"0x{random.randrange(10 ** 18):064x}",
+        })
+    return logs
+
+
+def bench(name, func, logs, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(logs)
+        best = min(best, time.perf_counter() - started)
+    return [name, f"{best * 1000:.1f}", f"{len(logs) / best:,.0f}"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Микробенчмарк декодирования логов")
+    parser.add_argument("--logs", type=int, default=100_000, help="Количество логов")
+    parser.add_argument("--per-block", type=int, default=20, help="Логов на один блок")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество повторов (берётся лучший)")
+    args = parser.parse_args()
+
+    logs = make_logs(args.logs, args.per_block)
+
+    rows = [
+        bench("parse_log (row-wise)", lambda page: [main.parse_log(r) for r in page], logs, args.repeat),
+        bench("decode_logs_columnar", main.decode_logs_columnar, logs, args.repeat),
+    ]
+    print(tabulate(rows, headers=["Decoder", "Best, ms", "Logs/s"], tablefmt="grid"))
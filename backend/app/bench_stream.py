@@ -0,0 +1,90 @@
+from tabulate import tabulate
+import aiohttp
+import argparse
+import asyncio
+import json
+import time
+
+import redis.asyncio as aioredis
+
+import app
+
+
+async def get_stats(session, base_url):
+    async with session.get(f"{base_url}/api/stream-stats") as response:
+        return await response.json()
+
+
+async def open_stream(session, base_url, connected, received):
+    """Держит одно SSE-подключение и отмечает время получения событий update"""
+    async with session.get(f"{base_url}/api/stream", timeout=aiohttp.ClientTimeout(total=None)) as response:
+        await response.content.readline()  # "retry: ..." — подключение установлено
+        connected.release()
+        async for line in response.content:
+            if line.startswith(b"event: update"):
+                received.append(time.perf_counter())
+
+
+async def run(args):
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        before = await get_stats(session, args.url)
+
+        connected = asyncio.Semaphore(0)
+        received = []
+        tasks = []
+        started = time.perf_counter()
+        for offset in range(0, args.connections, args.batch):
+            batch = min(args.batch, args.connections - offset)
+            tasks += [asyncio.create_task(open_stream(session, args.url, connected, received)) for _ in range(batch)]
+            for _ in range(batch):
+                await connected.acquire()
+        connect_time = time.perf_counter() - started
+
+        await asyncio.sleep(args.settle)
+        after = await get_stats(session, args.url)
+
+        rss_delta = after["rss_bytes"] - before["rss_bytes"]
+        connections = after["connected"] - before["connected"]
+        results = [
+            ["Connections", f"{connections:,}"],
+            ["Connect time, s", f"{connect_time:.2f}"],
+            ["RSS before, MB", f"{before['rss_bytes'] / 2 ** 20:.1f}"],
+            ["RSS after, MB", f"{after['rss_bytes'] / 2 ** 20:.1f}"],
+            ["RSS per connection, KB", f"{rss_delta / max(connections, 1) / 1024:.1f}"],
+        ]
+
+        if args.redis:
+            # Тестовое сообщение в канал рассылки: время, за которое его получат все клиенты
+            redis = aioredis.from_url(args.redis)
+            message = {"version": -1, "block": None, "full": True}
+            published = time.perf_counter()
+            await redis.publish(app.STREAM_CHANNEL, json.dumps(message))
+            deadline = published + args.timeout
+            while len(received) < len(tasks) and time.perf_counter() < deadline:
+                await asyncio.sleep(0.01)
+            await redis.close()
+            results.append(["Delivered", f"{len(received):,} / {len(tasks):,}"])
+            if received:
+                results.append(["Fan-out, last client, ms", f"{(max(received) - published) * 1000:.1f}"])
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    print(tabulate(results, headers=["Metric", "Value"], tablefmt="grid"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Нагрузочный тест /api/stream: память на подключение и время рассылки. "
+                    "Для тысяч подключений поднимите ulimit -n у клиента и сервера; "
+                    "при нескольких воркерах uvicorn статистика — одного воркера."
+    )
+    parser.add_argument("--url", default="http://localhost:8000", help="Адрес API")
+    parser.add_argument("--connections", type=int, default=2000, help="Количество SSE-подключений")
+    parser.add_argument("--batch", type=int, default=200, help="Сколько подключений открывать одновременно")
+    parser.add_argument("--settle", type=float, default=2.0, help="Пауза перед замером памяти, с")
+    parser.add_argument("--redis", help="REDIS_URL: опубликовать тестовое сообщение и замерить рассылку")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Сколько ждать доставки сообщения, с")
+    asyncio.run(run(parser.parse_args()))
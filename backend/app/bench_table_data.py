@@ -0,0 +1,54 @@
+from tabulate import tabulate
+import argparse
+import gzip
+import random
+import time
+
+import app
+
+
+def make_rows(count):
+    """Генерирует строки table-data в формате format_table_row"""
+    rows = []
+    for i in range(count):
+        delegated = random.randrange(0, 20)
+        rows.append([
+            f"0x{random.getrandbits(160):040x}",
+            random.choice([0, 1]),
+            random.choice(["0", "12.5", "100"]),
+            random.choice([0.0, 1.0, 1.5, 5.0, 10.0]),
+            round(random.uniform(90, 100), 1),
+            f"2024-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}T12:00:00Z",
+            delegated,
+            delegated + random.randrange(0, 10),
+            random.randrange(0, 10),
+            random.randrange(1, 30),
+            random.randrange(0, 30),
+            random.randrange(0, 20),
+            "2024-12-20T08:30:00Z",
+        ])
+    return rows
+
+
+def bench(name, encode, rows, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = encode(rows)
+        best = min(best, time.perf_counter() - started)
+    gzipped = gzip.compress(body, compresslevel=6)
+    return [name, f"{len(body):,}", f"{len(gzipped):,}", f"{best * 1000:.2f}"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение JSON и msgpack для /api/table-data")
+    parser.add_argument("--rows", type=int, default=5000, help="Количество операторов")
+    parser.add_argument("--repeat", type=int, default=10, help="Количество повторов (берётся лучший)")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    results = [
+        bench("json", app.dumps_json, rows, args.repeat),
+        bench("msgpack (columnar)", app.encode_table_data_msgpack, rows, args.repeat),
+    ]
+    print(tabulate(results, headers=["Format", "Bytes", "Gzip bytes", "Encode, ms"], tablefmt="grid"))
@@ -159,6 +159,17 @@ const App = ({ toggleTheme, darkMode }) => {
     document.title = "Sophon Inspector";
   }, []);
 
+  // Сервер присылает событие после каждого обновления данных — перечитываем дашборд
+  useEffect(() => {
+    const stream = new EventSource('/api/stream');
+    stream.addEventListener('update', (event) => {
+      const { full, changed = [], removed = [] } = JSON.parse(event.data);
+      if (!full && !changed.length && !removed.length) return; // данные не изменились
+      fetchData();
+    });
+    return () => stream.close();
+  }, []);
+
 
   const connectWallet = async () => {
     try {
@@ -178,26 +189,21 @@ const App = ({ toggleTheme, darkMode }) => {
 
   const fetchData = async () => {
     try {
-      const [tableResponse, promotionResponse, delegationResponse, commissionResponse, uptimeResponse, eventDynamicsResponse, operatorStatusResponse, systemResponse, topDelegatorsResponse] = await Promise.all([
-        fetch(`/api/table-data`),
-        fetch(`/api/promote-table`),
-        fetch(`/api/delegation-distribution`),
-        fetch(`/api/commission-distribution`),
-        fetch(`/api/uptime-distribution`),
-        fetch(`/api/event-dynamics`),
-        fetch(`/api/operator-status`),
-        fetch(`/api/system-info`),
-        fetch(`/api/top-delegators`),
-      ]);
-
-      const rawTableData = await tableResponse.json();
-      const rawPromoteTableData = await promotionResponse.json();
-      const delegationData = await delegationResponse.json();
-      const commissionData = await commissionResponse.json();
-      const uptimeData = await uptimeResponse.json();
-      const eventDynamicsData = await eventDynamicsResponse.json();
-      const operatorStatusData = await operatorStatusResponse.json();
-      const topDelegatorsData = await topDelegatorsResponse.json();
+      // Все данные страницы одним запросом
+      const dashboardResponse = await fetch(`/api/dashboard`);
+      if (!dashboardResponse.ok) {
+        throw new Error(`Dashboard request failed: ${dashboardResponse.status}`);
+      }
+      const dashboard = await dashboardResponse.json();
+
+      const rawTableData = dashboard.table_data;
+      const rawPromoteTableData = dashboard.promote_table;
+      const delegationData = dashboard.delegation_distribution;
+      const commissionData = dashboard.commission_distribution;
+      const uptimeData = dashboard.uptime_distribution;
+      const eventDynamicsData = dashboard.event_dynamics;
+      const operatorStatusData = dashboard.operator_status;
+      const topDelegatorsData = dashboard.top_delegators;
 
       const formattedDelegationDistributionData = {
         labels: delegationData.operators.map(op => `${op}`),
@@ -300,8 +306,7 @@ const App = ({ toggleTheme, darkMode }) => {
         rawTableData.map((row, index) => ({
           id: index,
           operator: row[0],
-          delegatorsCount: row[11] ? row[11].split(',').length : 0,
-          delegators: row[11] ? row[11].split(',') : [],
+          delegatorsCount: row[11] || 0,
           status: row[1] === 1 ? 'Active' : 'Inactive',
           rewards: row[2] || '-',
           fee: row[3] !== null ? row[3] : null,
@@ -312,7 +317,6 @@ const App = ({ toggleTheme, darkMode }) => {
           totalUndelegateAmount: row[8] || 0,
           totalDelegateOperations: row[9] || 0,
           totalUndelegateOperations: row[10] || 0,
-          currentDelegators: row[11] || 0,
           lastNodeUpdate: row[12] || null,
         }))
       );
@@ -341,7 +345,7 @@ const App = ({ toggleTheme, darkMode }) => {
         topDelegators: formattedTopDelegatorsData,
       });
 
-      setSystemInfo(await systemResponse.json());
+      setSystemInfo(dashboard.system_info);
     } catch (error) {
       console.error('Error fetching data:', error);
     }
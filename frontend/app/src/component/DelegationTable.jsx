@@ -24,7 +24,7 @@ import PeopleAltIcon from '@mui/icons-material/PeopleAlt';
 import Badge from '@mui/material/Badge';
 import { styled } from '@mui/material/styles';
 import CircularProgress from '@mui/material/CircularProgress';
-import { useQuery, QueryClientProvider, QueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, QueryClientProvider, QueryClient } from '@tanstack/react-query';
 import { padding } from '@mui/system';
 import ContentCopyIcon from '@mui/icons-material/ContentCopy';
 import BookmarkAddIcon from '@mui/icons-material/BookmarkAdd';
@@ -36,27 +36,50 @@ import { Switch, FormControlLabel } from '@mui/material';
 import HttpIcon from '@mui/icons-material/Http';
 import { useTheme } from '@mui/material/styles';
 
+const DETAILS_PAGE_SIZE = 100;
+
 // Хук для выполнения запросов
 const useFetchDetails = (operator, enabled) => {
-  return useQuery({
+  return useInfiniteQuery({
     queryKey: ['operatorDetails', operator],
-    queryFn: async () => {
+    queryFn: async ({ pageParam }) => {
+      const cursor = pageParam ? `&cursor=${pageParam}` : '';
       const response = await fetch(
-        `/api/operator-details?operator=${operator}`
+        `/api/operator-details?operator=${operator}&limit=${DETAILS_PAGE_SIZE}${cursor}`
       );
       if (!response.ok) {
         throw new Error('Failed to fetch details');
       }
-      return response.json();
+      // Курсор следующей страницы приходит в заголовке
+      return { rows: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
     },
+    initialPageParam: null,
+    getNextPageParam: (lastPage) => lastPage.nextCursor || undefined,
     enabled, // Запрос выполняется только если enabled = true
     staleTime: 60 * 1000, // Кэш сохраняется на 60 секунд
   });
 };
 
+// Текущие делегаторы оператора загружаются только при открытии диалога
+const useFetchDelegators = (operator, enabled) => {
+  return useQuery({
+    queryKey: ['operatorDelegators', operator],
+    queryFn: async () => {
+      const response = await fetch(`/api/operator-delegators?operator=${operator}`);
+      if (!response.ok) {
+        throw new Error('Failed to fetch delegators');
+      }
+      return response.json();
+    },
+    enabled: Boolean(operator) && enabled,
+    staleTime: 60 * 1000,
+  });
+};
+
 const DetailPanel = ({ row, showSnackbar }) => {
   const operator = row.original.operator;
-  const { data, isLoading, isError } = useFetchDetails(operator, row.getIsExpanded());
+  const { data: pages, isLoading, isError, hasNextPage, fetchNextPage, isFetchingNextPage } = useFetchDetails(operator, row.getIsExpanded());
+  const data = useMemo(() => (pages ? pages.pages.flatMap((page) => page.rows) : []), [pages]);
   const theme = useTheme();
 
   if (isLoading) {
@@ -166,6 +189,13 @@ const DetailPanel = ({ row, showSnackbar }) => {
       ) : (
         <Typography>No details available</Typography>
       )}
+      {hasNextPage && (
+        <Box sx={{ display: 'flex', justifyContent: 'center', padding: '8px' }}>
+          <Button size="small" onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+            {isFetchingNextPage ? 'Loading...' : 'Load more'}
+          </Button>
+        </Box>
+      )}
     </TableContainer>
   );
 };
@@ -180,7 +210,8 @@ const DelegationTable = ({ rows, isLoading, showSnackbar }) => {
     };
 
     const [openDelegatorsDialog, setOpenDelegatorsDialog] = useState(false);
-    const [selectedDelegators, setSelectedDelegators] = useState([]);
+    const [selectedOperator, setSelectedOperator] = useState(null);
+    const { data: selectedDelegators = [], isLoading: isDelegatorsLoading } = useFetchDelegators(selectedOperator, openDelegatorsDialog);
 
     const toggleFavorite = (operator) => {
       if (favorites.includes(operator)) {
@@ -265,7 +296,7 @@ const DelegationTable = ({ rows, isLoading, showSnackbar }) => {
         Cell: ({ row, cell }) => (
             <Tooltip title="View Delegators">
               <IconButton sx={{ padding: 0 }}
-                  onClick={() => handleDelegatorsClick(row.original.delegators)}
+                  onClick={() => handleDelegatorsClick(row.original.operator)}
               >
                   <StyledBadge badgeContent={cell.getValue()}>
                   <PeopleAltIcon />
@@ -301,7 +332,7 @@ const DelegationTable = ({ rows, isLoading, showSnackbar }) => {
 
         const handleOpen = async () => {
           try {
-            const response = await fetch(`https://monitor.sophon.xyz/nodes?operators=${operator}`);
+            const response = await fetch(`/api/node-info?operators=${operator}`);
             const data = await response.json();
             setNodeData(data);
             setOpen(true);
@@ -448,65 +479,10 @@ const DelegationTable = ({ rows, isLoading, showSnackbar }) => {
     { accessorKey: 'totalUndelegateAmount', header: 'Total Undelegate Amount', size: 80, enableHiding: true },
     { accessorKey: 'totalDelegateOperations', header: 'Total Delegate Operations', size: 80, enableHiding: true },
     { accessorKey: 'totalUndelegateOperations', header: 'Total Undelegate Operations', size: 80, enableHiding: true },
-    { accessorKey: 'currentDelegators', 
-      header: 'Current Delegators', 
-      size: 80, 
-      enableHiding: true,
-      Cell: ({ cell }) => {
-        const values = cell.getValue();
-        const lines = values ? values.split(',') : [];
-      
-        return (
-          <Box
-            sx={{
-              display: 'flex',
-              flexDirection: 'column',
-              gap: '4px',
-            }}
-          >
-            {lines.length > 0 ? (
-              lines.map((line, index) => {
-                const shortenedValue = `${line.slice(0, 6)}...${line.slice(-4)}`; // Сокращаем каждую строку
-                return (
-                  <Box
-                    key={index}
-                    sx={{
-                      display: 'flex',
-                      alignItems: 'center',
-                      gap: '8px',
-                    }}
-                  >
-                    <Typography variant="body2" noWrap>
-                      {shortenedValue}
-                    </Typography>
-                    <Tooltip title="Copy to clipboard">
-                      <IconButton
-                        onClick={() => {
-                          navigator.clipboard.writeText(line);
-                          showSnackbar(`Value ${line} copied to clipboard`, 'success');
-                        }}
-                        sx={{ padding: '0px 0px 0px 4px', margin: '0px' }}
-                      >
-                        <ContentCopyIcon />
-                      </IconButton>
-                    </Tooltip>
-                  </Box>
-                );
-              })
-            ) : (
-              <Typography variant="body2" color="textSecondary">
-                -
-              </Typography>
-            )}
-          </Box>
-        );
-      },
-      
-    },
   ];
 
-  const handleDelegatorsClick = (delegators) => {
-    setSelectedDelegators(delegators);
+  const handleDelegatorsClick = (operator) => {
+    setSelectedOperator(operator);
     setOpenDelegatorsDialog(true);
   };
 
@@ -577,7 +553,6 @@ const DelegationTable = ({ rows, isLoading, showSnackbar }) => {
         totalUndelegateAmount: false, 
         totalDelegateOperations: false, 
         totalUndelegateOperations: false,
-        currentDelegators: false,
       },
       sorting: [{ id: 'createdAt', desc: true }],
       pagination: { pageSize:25, pageIndex: 0 },
@@ -606,9 +581,13 @@ const DelegationTable = ({ rows, isLoading, showSnackbar }) => {
       <Dialog open={openDelegatorsDialog} onClose={handleCloseDialog} fullWidth maxWidth="sm">
         <DialogTitle>Delegators</DialogTitle>
         <DialogContent>
-          {selectedDelegators.length > 0 ? (
-            selectedDelegators.map((delegator, index) => (
-              <Typography key={index}>
+          {isDelegatorsLoading ? (
+            <Box sx={{ display: 'flex', justifyContent: 'center', padding: '16px' }}>
+              <CircularProgress />
+            </Box>
+          ) : selectedDelegators.length > 0 ? (
+            selectedDelegators.map(([delegator, amount]) => (
+              <Typography key={delegator}>
                 <a
                   href={`https://explorer.sophon.xyz/address/${delegator}`}
                   target="_blank"
@@ -617,6 +596,7 @@ const DelegationTable = ({ rows, isLoading, showSnackbar }) => {
                 >
                   {delegator}
                 </a>
+                {` — ${amount}`}
               </Typography>
             ))
           ) : (